@@ -1,16 +1,44 @@
 import hashlib
+import importlib.util
 import json
 from pathlib import Path
+from threading import Lock, RLock
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
 from epftoolbox2.logging import get_logger
 
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+# pyarrow's CSV reader infers second resolution; cast back to the resolution the
+# default C engine produces for parsed timestamps: "ns" on pandas 2, "us" on pandas 3
+_INDEX_UNIT = "ns" if int(pd.__version__.split(".")[0]) < 3 else "us"
+
+
+def read_csv_cache(path: Path) -> pd.DataFrame:
+    """Read a cached CSV file into a DataFrame with a UTC DatetimeIndex.
+
+    Uses pyarrow's multithreaded CSV parser when pyarrow is installed. The index
+    is cast to _INDEX_UNIT, since pyarrow infers seconds. pyarrow also reads the
+    blank index header written by to_csv as "" rather than None, so an empty index
+    name is normalized to None to match the C engine.
+    """
+    df = pd.read_csv(path, index_col=0, engine=_CSV_ENGINE)
+    df.index = pd.to_datetime(df.index, utc=True).as_unit(_INDEX_UNIT)
+    df.index.name = df.index.name or None  # "" (pyarrow, unnamed index) -> None
+    return df
+
 
 class CacheManager:
     def __init__(self, cache_dir: str = ".cache/sources"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(__name__)
+        self._lock = Lock()
+        self._key_locks: Dict[str, RLock] = {}
+
+    def key_lock(self, cache_key: str) -> RLock:
+        """Lock serializing all reads and writes of one cache key across threads using this manager."""
+        with self._lock:
+            return self._key_locks.setdefault(cache_key, RLock())
 
     def get_cache_key(self, source_config: Dict) -> str:
         config_str = json.dumps(source_config, sort_keys=True)
@@ -39,7 +67,8 @@ class CacheManager:
         return f"data_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.csv"
 
     def find_missing_ranges(self, cache_key: str, requested_start: pd.Timestamp, requested_end: pd.Timestamp) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
-        metadata = self._read_metadata(cache_key)
+        with self.key_lock(cache_key):
+            metadata = self._read_metadata(cache_key)
         cached_ranges = metadata.get("cached_ranges", [])
 
         if not cached_ranges:
@@ -66,24 +95,23 @@ class CacheManager:
         return missing_ranges
 
     def read_cached_data(self, cache_key: str, start: pd.Timestamp, end: pd.Timestamp) -> Optional[pd.DataFrame]:
-        metadata = self._read_metadata(cache_key)
-        cached_ranges = metadata.get("cached_ranges", [])
+        with self.key_lock(cache_key):
+            metadata = self._read_metadata(cache_key)
+            cached_ranges = metadata.get("cached_ranges", [])
 
-        if not cached_ranges:
-            return None
+            if not cached_ranges:
+                return None
 
-        cache_path = self._get_cache_path(cache_key)
-        overlapping_chunks = []
+            cache_path = self._get_cache_path(cache_key)
+            overlapping_chunks = []
 
-        for cache_range in cached_ranges:
-            cache_start, cache_end = pd.Timestamp(cache_range["start"]), pd.Timestamp(cache_range["end"])
-            if cache_start < end and cache_end > start:
-                filepath = cache_path / cache_range["filename"]
-                if filepath.exists():
-                    df = pd.read_csv(filepath, index_col=0, parse_dates=True)
-                    if df.index.tzinfo is None:
-                        df.index = df.index.tz_localize("UTC")
-                    overlapping_chunks.append(df.loc[start:end])
+            for cache_range in cached_ranges:
+                cache_start, cache_end = pd.Timestamp(cache_range["start"]), pd.Timestamp(cache_range["end"])
+                if cache_start < end and cache_end > start:
+                    filepath = cache_path / cache_range["filename"]
+                    if filepath.exists():
+                        df = read_csv_cache(filepath)
+                        overlapping_chunks.append(df.loc[start:end])
 
         if not overlapping_chunks:
             return None
@@ -95,27 +123,29 @@ class CacheManager:
         if df.empty:
             return
 
-        cache_path = self._get_cache_path(cache_key)
-        filename = self._get_data_filename(start, end)
-        df.to_csv(cache_path / filename)
+        with self.key_lock(cache_key):
+            cache_path = self._get_cache_path(cache_key)
+            filename = self._get_data_filename(start, end)
+            df.to_csv(cache_path / filename)
 
-        metadata = self._read_metadata(cache_key)
-        if "source_config" not in metadata:
-            metadata["source_config"] = source_config
+            metadata = self._read_metadata(cache_key)
+            if "source_config" not in metadata:
+                metadata["source_config"] = source_config
 
-        new_range = {"start": start.isoformat(), "end": end.isoformat(), "filename": filename}
+            new_range = {"start": start.isoformat(), "end": end.isoformat(), "filename": filename}
 
-        existing_idx = next((i for i, r in enumerate(metadata.get("cached_ranges", [])) if r["filename"] == filename), None)
-        if existing_idx is not None:
-            metadata["cached_ranges"][existing_idx] = new_range
-        else:
-            metadata.setdefault("cached_ranges", []).append(new_range)
+            existing_idx = next((i for i, r in enumerate(metadata.get("cached_ranges", [])) if r["filename"] == filename), None)
+            if existing_idx is not None:
+                metadata["cached_ranges"][existing_idx] = new_range
+            else:
+                metadata.setdefault("cached_ranges", []).append(new_range)
 
-        self._write_metadata(cache_key, metadata)
+            self._write_metadata(cache_key, metadata)
         self.logger.debug(f"Cached data: {filename}")
 
     def get_cache_info(self, cache_key: str) -> Dict:
-        metadata = self._read_metadata(cache_key)
+        with self.key_lock(cache_key):
+            metadata = self._read_metadata(cache_key)
         cached_ranges = metadata.get("cached_ranges", [])
         if not cached_ranges:
             return {"exists": False, "num_chunks": 0, "date_ranges": []}
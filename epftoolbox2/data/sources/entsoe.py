@@ -5,16 +5,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 from bs4.builder import XMLParsedAsHTMLWarning
-from rich.console import Console
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-)
-from epftoolbox2.logging import get_logger
+from epftoolbox2.logging import get_console, get_logger, shared_progress
 from .base import DataSource
 
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
@@ -182,7 +173,7 @@ class EntsoeSource(DataSource):
         self.types = type
         self.session = requests.Session()
 
-        self.console = Console()
+        self.console = get_console()
         self.logger = get_logger(__name__)
 
         self._validate_config()
@@ -220,14 +211,7 @@ class EntsoeSource(DataSource):
 
         all_results = {dtype: [] for dtype in self.types}
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=self.console,
-        ) as progress:
+        with shared_progress() as progress:
             task = progress.add_task(
                 f"[cyan]ENTSOE [{self.area_name}]: Downloading {', '.join(self.types)}...",
                 total=len(chunks),
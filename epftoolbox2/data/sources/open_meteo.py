@@ -2,17 +2,8 @@ import pandas as pd
 from pandas.tseries.offsets import DateOffset
 from typing import List
 import requests
-from rich.console import Console
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-)
 import time
-from epftoolbox2.logging import get_logger
+from epftoolbox2.logging import get_console, get_logger, shared_progress
 from .base import DataSource
 
 
@@ -84,7 +75,7 @@ class OpenMeteoSource(DataSource):
         self.prefix = prefix
         self.session = requests.Session()
 
-        self.console = Console()
+        self.console = get_console()
         self.logger = get_logger(__name__)
 
         self._validate_config()
@@ -137,14 +128,7 @@ class OpenMeteoSource(DataSource):
 
         all_results = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=self.console,
-        ) as progress:
+        with shared_progress() as progress:
             task = progress.add_task(
                 f"[cyan]Open-Meteo [{self.latitude}, {self.longitude}]: Downloading...",
                 total=len(chunks),
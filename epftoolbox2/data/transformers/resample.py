@@ -1,12 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
 from .base import Transformer
 
 
 class ResampleTransformer(Transformer):
-    def __init__(self, freq: str = "1h", method: str = "linear", columns: list[str] | str | None = None):
+    """Resample data to a regular frequency and fill the introduced gaps.
+
+    Args:
+        freq: Target pandas frequency string (e.g., "1h", "15min").
+        method: Fill method: "linear", "ffill" or "bfill".
+        columns: Column name(s) to fill. If None, all columns are filled.
+        auto_split: Resample each contiguous block separately when the index has
+            a gap longer than 1000 target periods, instead of materializing every
+            empty bin in between. Only applies to fixed frequencies; calendar
+            frequencies such as "ME" or "B" are always resampled in one block.
+        chunk_size: Number of groups handled per worker task when the index is a
+            (group, datetime) MultiIndex.
+
+    Example:
+        >>> transformer = ResampleTransformer(freq="1h", method="linear")
+        >>> result = transformer.transform(df)
+    """
+
+    _MAX_GAP_PERIODS = 1000
+
+    def __init__(self, freq: str = "1h", method: str = "linear", columns: list[str] | str | None = None, auto_split: bool = True, chunk_size: int = 100):
         self.freq = freq
         self.method = method
         self.columns = [columns] if isinstance(columns, str) else columns
+        self.auto_split = auto_split
+        self.chunk_size = chunk_size
         self._validate_method()
 
     def _validate_method(self) -> None:
@@ -14,28 +40,71 @@ class ResampleTransformer(Transformer):
         if self.method not in valid_methods:
             raise ValueError(f"Invalid method: '{self.method}'. Must be one of: {valid_methods}")
 
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        if not isinstance(df.index, pd.DatetimeIndex):
-            raise ValueError("DataFrame index must be a DatetimeIndex")
+    def _fill(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.method == "linear":
+            return df.interpolate(method="linear")
+        if self.method == "ffill":
+            return df.ffill()
+        return df.bfill()
+
+    def _split_at_gaps(self, df: pd.DataFrame) -> list[pd.DataFrame]:
+        try:
+            max_gap = pd.Timedelta(to_offset(self.freq).nanos, unit="ns") * self._MAX_GAP_PERIODS
+        except ValueError:
+            # Calendar offsets (months, business days, ...) have no fixed length
+            return [df]
+        # Gaps are measured between neighbours, so the blocks only partition time when sorted
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        cut_points = np.flatnonzero((df.index[1:] - df.index[:-1]) > max_gap) + 1
+        bounds = [0, *cut_points, len(df)]
+        return [df.iloc[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def _resample(self, df: pd.DataFrame) -> pd.DataFrame:
+        result = df.resample(self.freq).asfreq()
+
+        if self.columns is None:
+            return self._fill(result)
+        result[self.columns] = self._fill(result[self.columns])
+        return result
 
+    def _validate_columns(self, df: pd.DataFrame) -> None:
         if self.columns:
             missing_cols = set(self.columns) - set(df.columns)
             if missing_cols:
                 raise ValueError(f"Columns not found in DataFrame: {missing_cols}")
 
-        result = df.resample(self.freq).asfreq()
+    def _transform_single(self, df: pd.DataFrame) -> pd.DataFrame:
+        chunks = self._split_at_gaps(df) if self.auto_split else [df]
+        result = self._resample(df) if len(chunks) == 1 else pd.concat([self._resample(chunk) for chunk in chunks])
+        return result.round(3)
 
-        cols_to_interpolate = result.columns if self.columns is None else self.columns
-        subset = result[cols_to_interpolate]
-        if self.method == "linear":
-            subset = subset.interpolate(method="linear")
-        elif self.method == "ffill":
-            subset = subset.ffill()
-        elif self.method == "bfill":
-            subset = subset.bfill()
+    def _transform_chunk(self, groups: list[tuple]) -> list[pd.DataFrame]:
+        return [self._transform_single(group) for _, group in groups]
 
-        result[cols_to_interpolate] = subset
+    def _transform_groups(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df.index.nlevels != 2 or not isinstance(df.index.levels[1], pd.DatetimeIndex):
+            raise ValueError("MultiIndex must have (group, datetime) levels")
 
-        result = result.round(3)
+        groups = [(key, group.droplevel(0)) for key, group in df.groupby(level=0, sort=False)]
+        if not groups:
+            return df.copy()
 
-        return result
+        chunks = [groups[i : i + self.chunk_size] for i in range(0, len(groups), self.chunk_size)]
+        n_jobs = int(os.environ.get("MAX_THREADS", os.cpu_count() or 1))
+
+        with ThreadPoolExecutor(max_workers=min(n_jobs, len(chunks))) as pool:
+            results = [frame for frames in pool.map(self._transform_chunk, chunks) for frame in frames]
+
+        return pd.concat(results, keys=[key for key, _ in groups], names=df.index.names)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        if isinstance(df.index, pd.MultiIndex):
+            self._validate_columns(df)
+            return self._transform_groups(df)
+
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("DataFrame index must be a DatetimeIndex")
+
+        self._validate_columns(df)
+        return self._transform_single(df)
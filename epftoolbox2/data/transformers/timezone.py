@@ -1,3 +1,4 @@
+from datetime import tzinfo
 import pandas as pd
 from zoneinfo import ZoneInfo
 from .base import Transformer
@@ -10,13 +11,23 @@ class TimezoneTransformer(Transformer):
         >>> df = transformer.transform(df)
     """
 
-    def __init__(self, target_tz: str):
+    def __init__(self, target_tz: str | tzinfo):
         """
         Args:
             target_tz: Target timezone name (e.g., "Europe/Warsaw", "America/New_York")
+                or a named tzinfo: ZoneInfo("Europe/Warsaw") or a pytz timezone
         """
-        self.target_tz = target_tz
+        if isinstance(target_tz, tzinfo):
+            # Only named zones survive to_dict/save -> load, so fixed offsets are rejected
+            name = getattr(target_tz, "key", None) or getattr(target_tz, "zone", None)
+            if not name:
+                raise ValueError(f"Invalid timezone: {target_tz!r} has no IANA name")
+            self.target_tz = name
+        else:
+            self.target_tz = target_tz
         self._validate_timezone()
+        # Names are converted as before, so pandas picks its default tz backend for them
+        self._tz = target_tz
 
     def _validate_timezone(self) -> None:
         try:
@@ -31,8 +42,8 @@ class TimezoneTransformer(Transformer):
         result = df.copy()
 
         if result.index.tz is None:
-            result.index = result.index.tz_localize("UTC").tz_convert(self.target_tz)
+            result.index = result.index.tz_localize("UTC").tz_convert(self._tz)
         else:
-            result.index = result.index.tz_convert(self.target_tz)
+            result.index = result.index.tz_convert(self._tz)
 
         return result
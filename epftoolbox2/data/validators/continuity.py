@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from .base import Validator
 from .result import ValidationResult
@@ -20,14 +21,14 @@ class ContinuityValidator(Validator):
             return result
 
         expected_delta = pd.Timedelta(self.freq)
-        actual_deltas = df.index.to_series().diff().dropna()
-        gaps = actual_deltas[actual_deltas > expected_delta]
+        actual_deltas = df.index[1:] - df.index[:-1]
+        gaps = np.flatnonzero(actual_deltas > expected_delta)
 
         if len(gaps) > 0:
             result.is_valid = False
             gap_info = []
-            for gap_end, delta in gaps.items():
-                gap_start = gap_end - delta
+            for pos in gaps:
+                gap_start, gap_end, delta = df.index[pos], df.index[pos + 1], actual_deltas[pos]
                 gap_info.append({"start": gap_start, "end": gap_end, "duration": delta})
                 result.errors.append(f"Gap detected (expected {self.freq} frequency): {gap_start} to {gap_end} ({delta})")
             result.info["gaps"] = gap_info
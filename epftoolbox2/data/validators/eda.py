@@ -1,15 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
+import os
+import numpy as np
 import pandas as pd
-from rich.console import Console
 from rich.table import Table
+from epftoolbox2.logging import get_console
 from .base import Validator
 from .result import ValidationResult
 
+_STAT_NAMES = ["count", "min", "max", "mean", "std", "25%", "50%", "75%"]
+
 
 class EdaValidator(Validator):
     def __init__(self, columns: Optional[List[str]] = None):
         self.columns = columns
-        self.console = Console()
+        self.console = get_console()
 
     def validate(self, df: pd.DataFrame) -> ValidationResult:
         result = ValidationResult()
@@ -24,37 +29,62 @@ class EdaValidator(Validator):
             result.warnings.append("No numeric columns to analyze")
             return result
 
-        stats_data = []
+        existing = set(df.columns)
         for col in cols:
-            if col not in df.columns:
+            if col not in existing:
                 result.warnings.append(f"Column '{col}' not found")
-                continue
-
-            series = df[col]
-            null_count = series.isnull().sum()
-            stats_data.append(
-                {
-                    "column": col,
-                    "dtype": str(series.dtype),
-                    "count": series.count(),
-                    "null_count": null_count,
-                    "null_pct": (null_count / len(series) * 100) if len(series) > 0 else 0,
-                    "min": series.min(),
-                    "max": series.max(),
-                    "mean": series.mean(),
-                    "std": series.std(),
-                    "25%": series.quantile(0.25),
-                    "50%": series.quantile(0.50),
-                    "75%": series.quantile(0.75),
-                }
-            )
+        cols = [col for col in cols if col in existing]
 
-        result.stats = pd.DataFrame(stats_data)
-        result.info["columns_analyzed"] = len(stats_data)
+        result.stats = self._compute_stats(df, cols) if cols else pd.DataFrame()
+        result.info["columns_analyzed"] = len(result.stats)
 
-        self._print_table(stats_data)
+        self._print_table(result.stats.to_dict("records"))
         return result
 
+    @staticmethod
+    def _reduce_tile(arr: np.ndarray) -> np.ndarray:
+        stats = np.full((len(_STAT_NAMES), arr.shape[1]), np.nan)
+        count = (~np.isnan(arr)).sum(axis=0)
+        stats[0] = count
+
+        valid = count > 0
+        if valid.any():
+            block = arr[:, valid]
+            stats[1, valid] = np.nanmin(block, axis=0)
+            stats[2, valid] = np.nanmax(block, axis=0)
+            stats[3, valid] = np.nanmean(block, axis=0)
+            stats[5:, valid] = np.nanquantile(block, [0.25, 0.50, 0.75], axis=0)
+
+        spread = count > 1
+        if spread.any():
+            stats[4, spread] = np.nanstd(arr[:, spread], axis=0, ddof=1)
+        return stats
+
+    def _compute_stats(self, df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+        data = df[cols]
+        arr = data.to_numpy(dtype=np.float64)
+        n = len(arr)
+
+        n_jobs = min(int(os.environ.get("MAX_THREADS", os.cpu_count() or 1)), len(cols))
+        tiles = np.array_split(np.arange(len(cols)), n_jobs)
+        if n_jobs > 1:
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                reduced = np.hstack(list(pool.map(self._reduce_tile, (arr[:, tile] for tile in tiles))))
+        else:
+            reduced = self._reduce_tile(arr)
+
+        count = reduced[0].astype(int)
+        return pd.DataFrame(
+            {
+                "column": cols,
+                "dtype": data.dtypes.astype(str).to_numpy(),
+                "count": count,
+                "null_count": n - count,
+                "null_pct": (n - count) / n * 100,
+                **dict(zip(_STAT_NAMES[1:], reduced[1:])),
+            }
+        )
+
     def _print_table(self, stats_data: List[dict]) -> None:
         table = Table(title="EDA Statistics", show_lines=True)
         table.add_column("Column", style="cyan", no_wrap=True)
@@ -1,9 +1,23 @@
 import logging
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator, Optional
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.progress import (
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    BarColumn,
+    TaskProgressColumn,
+    TimeRemainingColumn,
+)
 
 _console = Console()
 _configured_loggers = set()
+_progress_lock = Lock()
+_progress: Optional[Progress] = None
+_progress_users = 0
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -16,3 +30,39 @@ def get_logger(name: str) -> logging.Logger:
         _configured_loggers.add(name)
 
     return logger
+
+
+def get_console() -> Console:
+    return _console
+
+
+@contextmanager
+def shared_progress() -> Iterator[Progress]:
+    """Progress display on the shared console.
+
+    A terminal can only show one live display at a time, so callers running
+    concurrently (e.g. sources fetched in parallel) get the same Progress and
+    each add their own task to it. The display stops when the last caller exits.
+    """
+    global _progress, _progress_users
+    with _progress_lock:
+        if _progress is None:
+            _progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeRemainingColumn(),
+                console=_console,
+            )
+            _progress.start()
+        _progress_users += 1
+        progress = _progress
+    try:
+        yield progress
+    finally:
+        with _progress_lock:
+            _progress_users -= 1
+            if _progress_users == 0:
+                _progress.stop()
+                _progress = None
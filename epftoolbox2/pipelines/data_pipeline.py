@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import methodcaller
 from typing import List, Optional, Union, Dict, Any
 import pandas as pd
 from pathlib import Path
@@ -7,7 +10,7 @@ import importlib
 from epftoolbox2.data.sources.base import DataSource
 from epftoolbox2.data.transformers.base import Transformer
 from epftoolbox2.data.validators.base import Validator
-from epftoolbox2.data.cache_manager import CacheManager
+from epftoolbox2.data.cache_manager import CacheManager, read_csv_cache
 from epftoolbox2.logging import get_logger
 
 logger = get_logger(__name__)
@@ -63,19 +66,19 @@ class DataPipeline:
         self.validators: List[Validator] = validators or []
 
     def add_source(self, source: DataSource) -> "DataPipeline":
-        if not isinstance(source, DataSource):
+        if __debug__ and not isinstance(source, DataSource):
             raise TypeError("source must be a DataSource instance")
         self.sources.append(source)
         return self
 
     def add_transformer(self, transformer: Transformer) -> "DataPipeline":
-        if not isinstance(transformer, Transformer):
+        if __debug__ and not isinstance(transformer, Transformer):
             raise TypeError("transformer must be a Transformer instance")
         self.transformers.append(transformer)
         return self
 
     def add_validator(self, validator: Validator) -> "DataPipeline":
-        if not isinstance(validator, Validator):
+        if __debug__ and not isinstance(validator, Validator):
             raise TypeError("validator must be a Validator instance")
         self.validators.append(validator)
         return self
@@ -86,32 +89,35 @@ class DataPipeline:
             return source.fetch(start, end)
 
         cache_key = cache_manager.get_cache_key(source_config)
-        missing_ranges = cache_manager.find_missing_ranges(cache_key, start, end)
-        source_type = source_config.get("source_type", "unknown")
+        # Sources sharing a key are fetched in parallel; hold the key for the whole
+        # find -> fetch -> write -> read sequence so they never see half-written files
+        with cache_manager.key_lock(cache_key):
+            missing_ranges = cache_manager.find_missing_ranges(cache_key, start, end)
+            source_type = source_config.get("source_type", "unknown")
 
-        if not missing_ranges:
-            logger.info(f"Cache: Full hit for {source_type} source")
-            return cache_manager.read_cached_data(cache_key, start, end)
+            if not missing_ranges:
+                logger.info("Cache: Full hit for %s source", source_type)
+                return cache_manager.read_cached_data(cache_key, start, end)
 
-        if len(missing_ranges) == 1 and missing_ranges[0] == (start, end):
-            logger.info(f"Cache: Miss for {source_type} source")
-        else:
-            logger.info(f"Cache: Partial hit for {source_type} source")
+            if len(missing_ranges) == 1 and missing_ranges[0] == (start, end):
+                logger.info("Cache: Miss for %s source", source_type)
+            else:
+                logger.info("Cache: Partial hit for %s source", source_type)
 
-        for missing_start, missing_end in missing_ranges:
-            fresh_df = source.fetch(missing_start, missing_end)
-            if fresh_df is not None and not fresh_df.empty:
-                cache_manager.write_cache(cache_key, fresh_df, missing_start, missing_end, source_config)
+            for missing_start, missing_end in missing_ranges:
+                fresh_df = source.fetch(missing_start, missing_end)
+                if fresh_df is not None and not fresh_df.empty:
+                    cache_manager.write_cache(cache_key, fresh_df, missing_start, missing_end, source_config)
 
-        df = cache_manager.read_cached_data(cache_key, start, end)
-        return df if df is not None else pd.DataFrame()
+            df = cache_manager.read_cached_data(cache_key, start, end)
+            return df if df is not None else pd.DataFrame()
 
     def _parse_timestamp(self, ts: Union[str, pd.Timestamp]) -> pd.Timestamp:
+        if isinstance(ts, pd.Timestamp):
+            return ts.tz_convert("UTC") if ts.tzinfo else ts.tz_localize("UTC")
         if ts == "today":
             return pd.Timestamp("today", tz="UTC").normalize()
-        if isinstance(ts, str):
-            return pd.Timestamp(ts, tz="UTC")
-        return ts.tz_convert("UTC") if ts.tzinfo else ts.tz_localize("UTC")
+        return pd.Timestamp(ts, tz="UTC")
 
     def run(self, start: Union[str, pd.Timestamp], end: Union[str, pd.Timestamp], cache: Union[bool, str] = False) -> pd.DataFrame:
         if not self.sources:
@@ -130,32 +136,41 @@ class DataPipeline:
         result = self._run_transformers(result)
         self._run_validators(result)
 
-        logger.info(f"Pipeline: Completed with {len(result)} rows")
+        logger.info("Pipeline: Completed with %d rows", len(result))
         return result
 
     def _load_or_fetch_sources(self, start: pd.Timestamp, end: pd.Timestamp, cache: Union[bool, str]) -> pd.DataFrame:
         if isinstance(cache, str):
             cache_file = Path(cache)
             if cache_file.exists():
-                logger.info(f"Cache: Loading source data from {cache}")
-                result = pd.read_csv(cache_file, index_col=0)
-                result.index = pd.to_datetime(result.index, utc=True)
-                return result
+                logger.info("Cache: Loading source data from %s", cache)
+                return self._read_cache_file(cache_file)
             result = self._run_sources(start, end, cache)
             if not result.empty:
-                result.to_csv(cache)
-                logger.info(f"Cache: Saved source data to {cache}")
+                self._write_cache_file(result, cache_file)
+                logger.info("Cache: Saved source data to %s", cache)
             return result
         return self._run_sources(start, end, cache)
 
+    def _read_cache_file(self, cache_file: Path) -> pd.DataFrame:
+        if cache_file.suffix == ".parquet":
+            return pd.read_parquet(cache_file)
+        return read_csv_cache(cache_file)
+
+    def _write_cache_file(self, df: pd.DataFrame, cache_file: Path) -> None:
+        if cache_file.suffix == ".parquet":
+            df.to_parquet(cache_file, compression="zstd")
+        else:
+            df.to_csv(cache_file)
+
     def _run_sources(self, start: pd.Timestamp, end: pd.Timestamp, cache: Union[bool, str]) -> pd.DataFrame:
-        cache_manager = CacheManager() if cache is True else None
-        dataframes = []
+        if cache is True:
+            fetch = partial(self._fetch_with_cache, start=start, end=end, cache_manager=CacheManager())
+        else:
+            fetch = methodcaller("fetch", start, end)
 
-        for source in self.sources:
-            df = self._fetch_with_cache(source, start, end, cache_manager) if cache is True else source.fetch(start, end)
-            if df is not None and not df.empty:
-                dataframes.append(df)
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as pool:
+            dataframes = [df for df in pool.map(fetch, self.sources) if df is not None and not df.empty]
 
         if not dataframes:
             logger.warning("Pipeline: No data returned from any source")
@@ -174,9 +189,9 @@ class DataPipeline:
             validator_name = type(validator).__name__
             if not validation_result.is_valid:
                 for error in validation_result.errors:
-                    logger.warning(f"Validation [{validator_name}]: {error}")
+                    logger.warning("Validation [%s]: %s", validator_name, error)
             for warning in validation_result.warnings:
-                logger.info(f"Validation [{validator_name}]: {warning}")
+                logger.info("Validation [%s]: %s", validator_name, warning)
 
     def _serialize_component(self, component: Any) -> Dict[str, Any]:
         class_name = type(component).__name__
@@ -201,7 +216,7 @@ class DataPipeline:
         config = self.to_dict()
         with open(path, "w") as f:
             yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-        logger.info(f"Pipeline: Saved configuration to {path}")
+        logger.info("Pipeline: Saved configuration to %s", path)
 
     @classmethod
     def _load_component(cls, component_type: str, config: Dict[str, Any]) -> Any:
@@ -233,5 +248,5 @@ class DataPipeline:
         for validator_config in config.get("validators", []):
             pipeline.add_validator(cls._load_component("validators", validator_config))
 
-        logger.info(f"Pipeline: Loaded configuration from {path}")
+        logger.info("Pipeline: Loaded configuration from %s", path)
         return pipeline
@@ -10,9 +10,19 @@ class EvaluationReport:
         self.results: Dict[str, pd.DataFrame] = {}
 
         for name, records in results.items():
-            df = pd.DataFrame(records)
-            df["year"] = pd.to_datetime(df["target_date"]).dt.year
-            self.results[name] = df
+            self.results[name] = self._with_year(pd.DataFrame(records))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, evaluators: List[Evaluator], model_col: str = "model") -> "EvaluationReport":
+        report = cls({}, evaluators)
+        for name, grp in df.groupby(model_col, sort=False):
+            report.results[name] = cls._with_year(grp.drop(columns=model_col).reset_index(drop=True))
+        return report
+
+    @staticmethod
+    def _with_year(df: pd.DataFrame) -> pd.DataFrame:
+        df["year"] = pd.to_datetime(df["target_date"]).dt.year
+        return df
 
     def _apply_evaluators(self, df: pd.DataFrame) -> Dict[str, float]:
         return {ev.name: ev.compute(df) for ev in self.evaluators}
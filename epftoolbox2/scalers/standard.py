@@ -18,16 +18,13 @@ class StandardScaler:
 
         scalable_mask = self.get_scalable_mask(train_x)
 
-        for i in range(train_x.shape[1]):
-            if not scalable_mask[i]:
-                continue
-            col = train_x[:, i]
-            mean = np.nanmean(col)
-            std = np.nanstd(col, ddof=1)
-            if std == 0 or np.isnan(std):
-                std = 1.0
-            train_x[:, i] = (col - mean) / std
-            test_x[:, i] = (test_x[:, i] - mean) / std
+        if scalable_mask.any():
+            scalable = train_x[:, scalable_mask]
+            means = np.nanmean(scalable, axis=0)
+            stds = np.nanstd(scalable, axis=0, ddof=1)
+            stds[(stds == 0) | np.isnan(stds)] = 1.0
+            train_x[:, scalable_mask] = (scalable - means) / stds
+            test_x[:, scalable_mask] = (test_x[:, scalable_mask] - means) / stds
 
         self._target_mean = np.nanmean(train_y)
         self._target_std = np.nanstd(train_y, ddof=1)
@@ -39,13 +36,8 @@ class StandardScaler:
 
     @staticmethod
     def get_scalable_mask(arr: np.ndarray) -> np.ndarray:
-        mask = np.ones(arr.shape[1], dtype=bool)
-        for i in range(arr.shape[1]):
-            col = arr[:, i]
-            unique = np.unique(col[~np.isnan(col)])
-            if len(unique) <= 2 and np.all((unique == 0) | (unique == 1)):
-                mask[i] = False
-        return mask
+        is_binary = np.all((arr == 0) | (arr == 1) | np.isnan(arr), axis=0)
+        return ~is_binary
 
     def inverse(self, value: float) -> float:
         return value * self._target_std + self._target_mean
@@ -1,4 +1,15 @@
 import sys
 from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from epftoolbox2.data.transformers import TimezoneTransformer  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def warsaw_transformer():
+    """Shared TimezoneTransformer to Europe/Warsaw (stateless, safe to reuse)"""
+    return TimezoneTransformer(target_tz=ZoneInfo("Europe/Warsaw"))
@@ -1,8 +1,13 @@
 import pytest
+import numpy as np
 import pandas as pd
+from zoneinfo import ZoneInfo
 
 from epftoolbox2.data.transformers import Transformer, TimezoneTransformer, ResampleTransformer, LagTransformer
 
+_WARSAW = ZoneInfo("Europe/Warsaw")
+_NY = ZoneInfo("America/New_York")
+
 
 class TestTimezoneTransformerInit:
     """Test TimezoneTransformer initialization"""
@@ -22,74 +27,83 @@ class TestTimezoneTransformerInit:
         with pytest.raises(ValueError, match="Invalid timezone"):
             TimezoneTransformer(target_tz="Invalid/Timezone")
 
+    def test_init_tzinfo(self):
+        """Test initialization with a tzinfo instance"""
+        transformer = TimezoneTransformer(target_tz=_WARSAW)
+        assert transformer.target_tz == "Europe/Warsaw"
+
+    def test_init_pytz_timezone(self):
+        """Test initialization with a pytz timezone"""
+        pytz = pytest.importorskip("pytz")
+        transformer = TimezoneTransformer(target_tz=pytz.timezone("Europe/Warsaw"))
+        assert transformer.target_tz == "Europe/Warsaw"
+
+    def test_init_unnamed_tzinfo_raises_error(self):
+        """Test that tzinfos without an IANA name are rejected"""
+        from datetime import timedelta, timezone
+
+        with pytest.raises(ValueError, match="no IANA name"):
+            TimezoneTransformer(target_tz=timezone(timedelta(hours=1)))
+
 
 class TestTimezoneTransformerTransform:
     """Test TimezoneTransformer transform method"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_utc_dataframe(self):
         """Create a sample DataFrame with UTC index"""
-        dates = pd.date_range("2024-01-01", periods=5, freq="h", tz="UTC")
+        dates = pd.date_range("2024-01-01", periods=5, freq="h").tz_localize("UTC")
         return pd.DataFrame({"value": [1, 2, 3, 4, 5]}, index=dates)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_naive_dataframe(self):
         """Create a sample DataFrame with timezone-naive index"""
         dates = pd.date_range("2024-01-01", periods=5, freq="h")
         return pd.DataFrame({"value": [1, 2, 3, 4, 5]}, index=dates)
 
-    def test_transform_utc_to_warsaw(self, sample_utc_dataframe):
-        """Test converting UTC to Europe/Warsaw"""
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        result = transformer.transform(sample_utc_dataframe)
-
-        assert str(result.index.tz) == "Europe/Warsaw"
-        # Warsaw is UTC+1 in winter
-        assert result.index[0].hour == 1  # 00:00 UTC -> 01:00 Warsaw
-
-    def test_transform_utc_to_new_york(self, sample_utc_dataframe):
-        """Test converting UTC to America/New_York"""
-        transformer = TimezoneTransformer(target_tz="America/New_York")
-        result = transformer.transform(sample_utc_dataframe)
-
-        assert str(result.index.tz) == "America/New_York"
-        # New York is UTC-5 in winter
-        assert result.index[0].hour == 19  # 00:00 UTC on Jan 1 -> 19:00 Dec 31 NY
-
-    def test_transform_naive_to_warsaw(self, sample_naive_dataframe):
-        """Test converting naive timestamps (assumed UTC) to Europe/Warsaw"""
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        result = transformer.transform(sample_naive_dataframe)
-
-        assert str(result.index.tz) == "Europe/Warsaw"
-        assert result.index[0].hour == 1  # 00:00 UTC -> 01:00 Warsaw
-
-    def test_transform_preserves_data(self, sample_utc_dataframe):
+    @pytest.mark.parametrize(
+        "fixture,tz,expected_hour",
+        [
+            ("sample_utc_dataframe", "Europe/Warsaw", 1),  # Warsaw is UTC+1 in winter
+            ("sample_utc_dataframe", _WARSAW, 1),
+            ("sample_utc_dataframe", "America/New_York", 19),  # New York is UTC-5: 00:00 UTC on Jan 1 -> 19:00 Dec 31
+            ("sample_utc_dataframe", _NY, 19),
+            ("sample_naive_dataframe", "Europe/Warsaw", 1),  # naive timestamps are assumed UTC
+        ],
+    )
+    def test_transform_converts_timezone(self, request, fixture, tz, expected_hour):
+        """Test converting UTC and naive timestamps to the target timezone"""
+        transformer = TimezoneTransformer(target_tz=tz)
+        result = transformer.transform(request.getfixturevalue(fixture))
+
+        assert str(result.index.tz) == str(tz)
+        assert result.index[0].hour == expected_hour
+
+    def test_transform_preserves_data(self, sample_utc_dataframe, warsaw_transformer):
         """Test that transform preserves the data values"""
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        result = transformer.transform(sample_utc_dataframe)
+        result = warsaw_transformer.transform(sample_utc_dataframe)
 
-        assert list(result["value"]) == [1, 2, 3, 4, 5]
+        assert np.array_equal(result["value"].to_numpy(), np.array([1, 2, 3, 4, 5]))
 
-    def test_transform_does_not_modify_original(self, sample_utc_dataframe):
+    def test_transform_does_not_modify_original(self, sample_utc_dataframe, warsaw_transformer):
         """Test that transform returns a copy, not modifying original"""
-        original_tz = str(sample_utc_dataframe.index.tz)
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        transformer.transform(sample_utc_dataframe)
+        original = sample_utc_dataframe.copy(deep=True)
+        original_tz = sample_utc_dataframe.index.tz
+        warsaw_transformer.transform(sample_utc_dataframe)
 
-        assert str(sample_utc_dataframe.index.tz) == original_tz
+        assert sample_utc_dataframe.index.tz == original_tz
+        pd.testing.assert_frame_equal(sample_utc_dataframe, original)
 
-    def test_transform_invalid_index_type(self):
+    def test_transform_invalid_index_type(self, warsaw_transformer):
         """Test that non-DatetimeIndex raises error"""
         df = pd.DataFrame({"value": [1, 2, 3]}, index=[0, 1, 2])
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
 
         with pytest.raises(ValueError, match="DatetimeIndex"):
-            transformer.transform(df)
+            warsaw_transformer.transform(df)
 
-    def test_transform_multiple_columns(self):
+    def test_transform_multiple_columns(self, warsaw_transformer):
         """Test transform with multiple columns"""
-        dates = pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC")
+        dates = pd.date_range("2024-01-01", periods=3, freq="h").tz_localize("UTC")
         df = pd.DataFrame(
             {
                 "price": [10.0, 20.0, 30.0],
@@ -98,12 +112,11 @@ class TestTimezoneTransformerTransform:
             index=dates,
         )
 
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        result = transformer.transform(df)
+        result = warsaw_transformer.transform(df)
 
         assert list(result.columns) == ["price", "load"]
-        assert list(result["price"]) == [10.0, 20.0, 30.0]
-        assert list(result["load"]) == [100, 200, 300]
+        assert np.array_equal(result["price"].to_numpy(), np.array([10.0, 20.0, 30.0]))
+        assert np.array_equal(result["load"].to_numpy(), np.array([100, 200, 300]))
 
 
 class TestTransformerAbstract:
@@ -128,6 +141,7 @@ class TestResampleTransformerInit:
         transformer = ResampleTransformer()
         assert transformer.freq == "1h"
         assert transformer.method == "linear"
+        assert transformer.auto_split is True
 
     def test_init_custom_freq(self):
         """Test initialization with custom frequency"""
@@ -173,19 +187,19 @@ class TestResampleTransformerInit:
 class TestResampleTransformerTransform:
     """Test ResampleTransformer transform method"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_hourly_dataframe(self):
         """Create a sample DataFrame with hourly index"""
         dates = pd.date_range("2024-01-01", periods=5, freq="h")
         return pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_daily_dataframe(self):
         """Create a sample DataFrame with daily index"""
         dates = pd.date_range("2024-01-01", periods=3, freq="D")
         return pd.DataFrame({"value": [10.0, 20.0, 30.0]}, index=dates)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_tz_aware_dataframe(self):
         """Create a sample DataFrame with timezone-aware index"""
         dates = pd.date_range("2024-01-01", periods=5, freq="h", tz="Europe/Warsaw")
@@ -351,6 +365,72 @@ class TestResampleTransformerTransform:
         with pytest.raises(ValueError, match="Columns not found"):
             transformer.transform(sample_hourly_dataframe)
 
+    def test_transform_splits_at_outlier_gap(self):
+        """Test that a far-outlier timestamp does not materialize the empty bins in between"""
+        dates = pd.date_range("2024-01-01", periods=3, freq="h").append(pd.DatetimeIndex(["2030-01-01"]))
+        df = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0]}, index=dates)
+
+        transformer = ResampleTransformer(freq="30min", method="linear")
+        result = transformer.transform(df)
+
+        assert len(result) == 6
+        assert result["value"].iloc[1] == 1.5
+        assert result.index[-1] == pd.Timestamp("2030-01-01")
+
+    def test_transform_unsorted_index_with_outlier_gap(self):
+        """Test that gap splitting on an unsorted index matches resampling the sorted index"""
+        dates = pd.DatetimeIndex(["2024-01-01 02:00", "2030-01-01", "2024-01-01 00:00", "2024-01-01 01:00"])
+        df = pd.DataFrame({"value": [30.0, 40.0, 10.0, 20.0]}, index=dates)
+
+        result = ResampleTransformer(freq="1h").transform(df)
+
+        assert result.index.is_monotonic_increasing
+        assert result.index.is_unique
+        assert len(result) == 4
+        assert np.array_equal(result["value"].to_numpy(), np.array([10.0, 20.0, 30.0, 40.0]))
+
+    def test_transform_calendar_freq(self):
+        """Test that calendar frequencies resample without gap splitting"""
+        dates = pd.date_range("2024-01-01", periods=90, freq="D")
+        df = pd.DataFrame({"value": np.arange(90, dtype=float)}, index=dates)
+
+        result = ResampleTransformer(freq="ME").transform(df)
+
+        assert result.shape == (3, 1)
+        assert list(result.index) == list(pd.date_range("2024-01-31", periods=3, freq="ME"))
+
+    def test_transform_auto_split_disabled(self):
+        """Test that auto_split=False resamples across the whole index range"""
+        dates = pd.date_range("2024-01-01", periods=3, freq="D").append(pd.DatetimeIndex(["2024-06-01"]))
+        df = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0]}, index=dates)
+
+        result = ResampleTransformer(freq="1h", auto_split=False).transform(df)
+
+        assert len(result) == len(pd.date_range("2024-01-01", "2024-06-01", freq="h"))
+        assert result["value"].notna().all()
+
+    def test_transform_multiindex_groups(self):
+        """Test that each group of a (group, datetime) MultiIndex is resampled separately"""
+        dates = pd.date_range("2024-01-01", periods=3, freq="h")
+        index = pd.MultiIndex.from_product([["PL", "DE", "FR"], dates], names=["zone", "datetime"])
+        df = pd.DataFrame({"value": [1.0, 2.0, 3.0, 10.0, 20.0, 30.0, 5.0, 6.0, 7.0]}, index=index)
+
+        transformer = ResampleTransformer(freq="30min", method="linear", chunk_size=2)
+        result = transformer.transform(df)
+
+        assert list(result.index.names) == ["zone", "datetime"]
+        assert list(result.index.get_level_values("zone").unique()) == ["PL", "DE", "FR"]
+        assert len(result) == 15
+        assert result.loc[("DE", pd.Timestamp("2024-01-01 00:30")), "value"] == 15.0
+
+    def test_transform_multiindex_requires_datetime_level(self):
+        """Test that a MultiIndex without a datetime level raises error"""
+        index = pd.MultiIndex.from_product([["PL"], [0, 1]])
+        df = pd.DataFrame({"value": [1.0, 2.0]}, index=index)
+
+        with pytest.raises(ValueError, match="group, datetime"):
+            ResampleTransformer().transform(df)
+
 
 class TestResampleTransformerIsTransformer:
     """Test ResampleTransformer inheritance"""
@@ -410,7 +490,7 @@ class TestLagTransformerInit:
 class TestLagTransformerTransform:
     """Test LagTransformer transform method"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_hourly_dataframe(self):
         """Create a sample DataFrame with 48 hours of hourly data"""
         dates = pd.date_range("2024-01-01", periods=48, freq="h")
@@ -477,7 +557,7 @@ class TestLagTransformerTransform:
 
         assert "price" in result.columns
         assert "load" in result.columns
-        assert list(result["price"]) == list(sample_hourly_dataframe["price"])
+        assert np.array_equal(result["price"].to_numpy(), sample_hourly_dataframe["price"].to_numpy())
 
     def test_transform_does_not_modify_original(self, sample_hourly_dataframe):
         """Test that transform returns a copy, not modifying original"""
@@ -123,6 +123,30 @@ class TestEdaValidator:
         assert stats.loc[0, "null_count"] == 2
         assert stats.loc[0, "null_pct"] == 40.0
 
+    def test_quantiles(self):
+        df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [10, 20, None, 40, 50]})
+
+        validator = EdaValidator()
+        result = validator.validate(df)
+
+        stats = result.stats.set_index("column")
+        assert list(stats.loc["a", ["25%", "50%", "75%"]]) == [2, 3, 4]
+        assert list(stats.loc["b", ["25%", "50%", "75%"]]) == [17.5, 30, 42.5]
+
+    def test_wide_frame_matches_pandas(self, monkeypatch):
+        monkeypatch.setenv("MAX_THREADS", "4")
+        df = pd.DataFrame({f"c{i}": [float(i * j) for j in range(20)] for i in range(10)})
+        df.iloc[::3, 2] = None
+
+        validator = EdaValidator()
+        result = validator.validate(df)
+
+        expected = df.describe().T
+        stats = result.stats.set_index("column")
+        assert list(stats.index) == list(df.columns)
+        for stat in ["count", "min", "max", "mean", "std", "25%", "50%", "75%"]:
+            pd.testing.assert_series_equal(stats[stat], expected[stat], check_names=False, check_dtype=False, check_index_type=False)
+
     def test_specific_columns(self):
         df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
 
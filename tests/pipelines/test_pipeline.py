@@ -1,11 +1,18 @@
 import pytest
+import numpy as np
 import pandas as pd
+from zoneinfo import ZoneInfo
 
 from epftoolbox2.data.sources.base import DataSource
 from epftoolbox2.data.transformers.base import Transformer
 from epftoolbox2.data.transformers import TimezoneTransformer
 from epftoolbox2.pipelines import DataPipeline
 
+_WARSAW = ZoneInfo("Europe/Warsaw")
+_START = pd.Timestamp("2024-01-01", tz="UTC")
+_END = pd.Timestamp("2024-01-02", tz="UTC")
+_HOURLY_5_UTC = pd.date_range("2024-01-01", periods=5, freq="h").tz_localize("UTC")
+
 
 class MockDataSource(DataSource):
     """Mock data source for testing"""
@@ -19,9 +26,7 @@ class MockDataSource(DataSource):
     def fetch(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
         self.fetch_called = True
         self.fetch_args = (start, end)
-        if self.data is None:
-            return pd.DataFrame()
-        return self.data.copy()
+        return self.data if self.data is not None else pd.DataFrame()
 
     def _validate_config(self) -> bool:
         return True
@@ -39,30 +44,26 @@ class MockTransformer(Transformer):
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         self.transform_called = True
-        result = df.copy()
-        result.columns = [f"{col}{self.suffix}" for col in result.columns]
-        return result
+        return df.add_suffix(self.suffix)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe_1():
     """First sample DataFrame"""
-    dates = pd.date_range("2024-01-01", periods=5, freq="h", tz="UTC")
-    return pd.DataFrame({"price": [10.0, 20.0, 30.0, 40.0, 50.0]}, index=dates)
+    return pd.DataFrame({"price": [10.0, 20.0, 30.0, 40.0, 50.0]}, index=_HOURLY_5_UTC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe_2():
     """Second sample DataFrame with different columns"""
-    dates = pd.date_range("2024-01-01", periods=5, freq="h", tz="UTC")
-    return pd.DataFrame({"load": [100, 200, 300, 400, 500]}, index=dates)
+    return pd.DataFrame({"load": [100, 200, 300, 400, 500]}, index=_HOURLY_5_UTC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe_partial():
     """DataFrame with partial overlap"""
-    dates = pd.date_range("2024-01-01 02:00", periods=3, freq="h", tz="UTC")
-    return pd.DataFrame({"weather": [1.0, 2.0, 3.0]}, index=dates)
+    # Last three hours of the shared index: 02:00-04:00 UTC
+    return pd.DataFrame({"weather": [1.0, 2.0, 3.0]}, index=_HOURLY_5_UTC[2:])
 
 
 class TestDataPipelineInit:
@@ -84,11 +85,10 @@ class TestDataPipelineInit:
 
         assert len(pipeline.sources) == 2
 
-    def test_init_with_transformers(self, sample_dataframe_1):
+    def test_init_with_transformers(self, sample_dataframe_1, warsaw_transformer):
         """Test initialization with transformers"""
         source = MockDataSource(data=sample_dataframe_1)
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        pipeline = DataPipeline(sources=[source], transformers=[transformer])
+        pipeline = DataPipeline(sources=[source], transformers=[warsaw_transformer])
 
         assert len(pipeline.transformers) == 1
 
@@ -102,100 +102,63 @@ class TestDataPipelineInit:
 class TestDataPipelineBuilder:
     """Test DataPipeline builder pattern"""
 
-    def test_add_source(self, sample_dataframe_1):
-        """Test adding a source via builder"""
-        source = MockDataSource(data=sample_dataframe_1)
-        pipeline = DataPipeline().add_source(source)
-
-        assert len(pipeline.sources) == 1
-        assert pipeline.sources[0] is source
-
-    def test_add_source_returns_self(self, sample_dataframe_1):
-        """Test that add_source returns self for chaining"""
-        source = MockDataSource(data=sample_dataframe_1)
-        pipeline = DataPipeline()
-        result = pipeline.add_source(source)
-
-        assert result is pipeline
-
-    def test_add_multiple_sources(self, sample_dataframe_1, sample_dataframe_2):
-        """Test adding multiple sources via chaining"""
-        source1 = MockDataSource(data=sample_dataframe_1)
-        source2 = MockDataSource(data=sample_dataframe_2)
-        pipeline = DataPipeline().add_source(source1).add_source(source2)
-
-        assert len(pipeline.sources) == 2
-
-    def test_add_transformer(self, sample_dataframe_1):
-        """Test adding a transformer via builder"""
-        source = MockDataSource(data=sample_dataframe_1)
-        transformer = MockTransformer()
-        pipeline = DataPipeline().add_source(source).add_transformer(transformer)
-
-        assert len(pipeline.transformers) == 1
-
-    def test_add_transformer_returns_self(self):
-        """Test that add_transformer returns self for chaining"""
-        transformer = MockTransformer()
-        pipeline = DataPipeline()
-        result = pipeline.add_transformer(transformer)
-
-        assert result is pipeline
-
-    def test_full_builder_chain(self, sample_dataframe_1, sample_dataframe_2):
-        """Test full builder pattern with multiple sources and transformers"""
+    def test_builder_chain(self, sample_dataframe_1, sample_dataframe_2, warsaw_transformer):
+        """Test adding sources and transformers via chaining"""
         source1 = MockDataSource(data=sample_dataframe_1)
         source2 = MockDataSource(data=sample_dataframe_2)
         transformer1 = MockTransformer(suffix="_first")
-        transformer2 = TimezoneTransformer(target_tz="Europe/Warsaw")
+        pipeline = DataPipeline()
 
-        pipeline = DataPipeline().add_source(source1).add_source(source2).add_transformer(transformer1).add_transformer(transformer2)
+        # Each add_* returns self for chaining
+        assert pipeline.add_source(source1) is pipeline
+        assert pipeline.sources == [source1]
+        assert pipeline.add_source(source2).add_transformer(transformer1) is pipeline
+        assert pipeline.add_transformer(warsaw_transformer) is pipeline
 
         assert len(pipeline.sources) == 2
+        assert pipeline.sources[0] is source1
+        assert pipeline.sources[1] is source2
         assert len(pipeline.transformers) == 2
+        assert pipeline.transformers[0] is transformer1
+        assert pipeline.transformers[1] is warsaw_transformer
 
-    def test_add_source_invalid_type(self):
-        """Test that add_source rejects invalid types"""
-        pipeline = DataPipeline()
+        # Invalid types are rejected without touching the pipeline
         with pytest.raises(TypeError, match="must be a DataSource"):
             pipeline.add_source("not a source")
-
-    def test_add_transformer_invalid_type(self):
-        """Test that add_transformer rejects invalid types"""
-        pipeline = DataPipeline()
         with pytest.raises(TypeError, match="must be a Transformer"):
             pipeline.add_transformer("not a transformer")
+        assert len(pipeline.sources) == 2
+        assert len(pipeline.transformers) == 2
 
 
 class TestDataPipelineRun:
     """Test DataPipeline run method"""
 
-    def test_run_single_source(self, sample_dataframe_1):
-        """Test running pipeline with a single source"""
-        source = MockDataSource(data=sample_dataframe_1)
-        pipeline = DataPipeline(sources=[source])
-
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
-
-        assert source.fetch_called
-        assert len(result) == 5
-        assert "price" in result.columns
-
-    def test_run_multiple_sources_merge(self, sample_dataframe_1, sample_dataframe_2):
-        """Test that multiple sources are merged correctly"""
-        source1 = MockDataSource(data=sample_dataframe_1)
-        source2 = MockDataSource(data=sample_dataframe_2)
-        pipeline = DataPipeline(sources=[source1, source2])
-
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
-
+    @pytest.mark.parametrize(
+        "source_fixtures,suffixes,expected_cols",
+        [
+            (["sample_dataframe_1"], [], ["price"]),
+            (["sample_dataframe_1", "sample_dataframe_2"], [], ["price", "load"]),
+            # Columns follow source order even though sources are fetched concurrently
+            (["sample_dataframe_2", "sample_dataframe_1"], [], ["load", "price"]),
+            (["sample_dataframe_1"], ["_test"], ["price_test"]),
+            # Transformers are applied in order
+            (["sample_dataframe_1"], ["_first", "_second"], ["price_first_second"]),
+        ],
+        ids=["single_source", "multiple_sources_merge", "preserves_source_order", "with_transformer", "multiple_transformers_chain"],
+    )
+    def test_run_configurations(self, request, source_fixtures, suffixes, expected_cols):
+        """Test running pipelines with different source and transformer setups"""
+        sources = [MockDataSource(data=request.getfixturevalue(name)) for name in source_fixtures]
+        transformers = [MockTransformer(suffix=suffix) for suffix in suffixes]
+        pipeline = DataPipeline(sources=sources, transformers=transformers)
+
+        result = pipeline.run(_START, _END)
+
+        assert all(source.fetch_called for source in sources)
+        assert all(transformer.transform_called for transformer in transformers)
         assert len(result) == 5
-        assert "price" in result.columns
-        assert "load" in result.columns
+        assert list(result.columns) == expected_cols
 
     def test_run_partial_overlap_outer_join(self, sample_dataframe_1, sample_dataframe_partial):
         """Test that partial overlap uses outer join"""
@@ -203,65 +166,31 @@ class TestDataPipelineRun:
         source2 = MockDataSource(data=sample_dataframe_partial)
         pipeline = DataPipeline(sources=[source1, source2])
 
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
+        result = pipeline.run(_START, _END)
 
         assert len(result) == 5  # Outer join preserves all rows
         assert "price" in result.columns
         assert "weather" in result.columns
         # First two rows should have NaN for weather
-        assert pd.isna(result["weather"].iloc[0])
-        assert pd.isna(result["weather"].iloc[1])
-        assert result["weather"].iloc[2] == 1.0
-
-    def test_run_with_transformer(self, sample_dataframe_1):
-        """Test that transformers are applied"""
-        source = MockDataSource(data=sample_dataframe_1)
-        transformer = MockTransformer(suffix="_test")
-        pipeline = DataPipeline(sources=[source], transformers=[transformer])
-
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
-
-        assert transformer.transform_called
-        assert "price_test" in result.columns
-
-    def test_run_multiple_transformers_chain(self, sample_dataframe_1):
-        """Test that multiple transformers are applied in order"""
-        source = MockDataSource(data=sample_dataframe_1)
-        transformer1 = MockTransformer(suffix="_first")
-        transformer2 = MockTransformer(suffix="_second")
-        pipeline = DataPipeline(sources=[source], transformers=[transformer1, transformer2])
-
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
+        weather = result["weather"].to_numpy()
+        assert np.isnan(weather[:2]).all()
+        assert weather[2] == 1.0
 
-        # Column should have both suffixes applied in order
-        assert "price_first_second" in result.columns
-
-    def test_run_timezone_transformer(self, sample_dataframe_1):
+    def test_run_timezone_transformer(self, sample_dataframe_1, warsaw_transformer):
         """Test with real TimezoneTransformer"""
         source = MockDataSource(data=sample_dataframe_1)
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
-        pipeline = DataPipeline(sources=[source], transformers=[transformer])
+        pipeline = DataPipeline(sources=[source], transformers=[warsaw_transformer])
 
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
+        result = pipeline.run(_START, _END)
 
-        assert str(result.index.tz) == "Europe/Warsaw"
+        assert result.index.tz == _WARSAW
 
     def test_run_empty_source_returns_empty(self):
         """Test that empty source returns empty DataFrame"""
         source = MockDataSource(data=None)
         pipeline = DataPipeline(sources=[source])
 
-        start = pd.Timestamp("2024-01-01", tz="UTC")
-        end = pd.Timestamp("2024-01-02", tz="UTC")
-        result = pipeline.run(start, end)
+        result = pipeline.run(_START, _END)
 
         assert result.empty
 
@@ -272,8 +201,8 @@ class TestDataPipelineRun:
 
         with pytest.raises(ValueError, match="must be after"):
             pipeline.run(
-                start=pd.Timestamp("2024-01-02", tz="UTC"),
-                end=pd.Timestamp("2024-01-01", tz="UTC"),
+                start=_END,
+                end=_START,
             )
 
     def test_run_localizes_naive_timestamps(self, sample_dataframe_1):
@@ -296,27 +225,26 @@ class TestDataPipelineRun:
 
         with pytest.raises(ValueError, match="At least one data source"):
             pipeline.run(
-                start=pd.Timestamp("2024-01-01", tz="UTC"),
-                end=pd.Timestamp("2024-01-02", tz="UTC"),
+                start=_START,
+                end=_END,
             )
 
-    def test_run_with_builder_pattern(self, sample_dataframe_1):
+    def test_run_with_builder_pattern(self, sample_dataframe_1, warsaw_transformer):
         """Test running pipeline built with builder pattern"""
         source = MockDataSource(data=sample_dataframe_1)
-        transformer = TimezoneTransformer(target_tz="Europe/Warsaw")
 
         result = (
             DataPipeline()
             .add_source(source)
-            .add_transformer(transformer)
+            .add_transformer(warsaw_transformer)
             .run(
-                start=pd.Timestamp("2024-01-01", tz="UTC"),
-                end=pd.Timestamp("2024-01-02", tz="UTC"),
+                start=_START,
+                end=_END,
             )
         )
 
         assert len(result) == 5
-        assert str(result.index.tz) == "Europe/Warsaw"
+        assert result.index.tz == _WARSAW
 
 
 class TestDataPipelineCache:
@@ -327,7 +255,7 @@ class TestDataPipelineCache:
         source = MockDataSource(data=sample_dataframe_1)
         pipeline = DataPipeline(sources=[source])
 
-        result = pipeline.run(start=pd.Timestamp("2024-01-01", tz="UTC"), end=pd.Timestamp("2024-01-02", tz="UTC"))
+        result = pipeline.run(start=_START, end=_END)
 
         assert len(result) == 5
         assert source.fetch_called
@@ -352,13 +280,102 @@ class TestDataPipelineCache:
             assert info["exists"] is False
 
             # Run with cache disabled first (default)
-            result = pipeline.run(start=pd.Timestamp("2024-01-01", tz="UTC"), end=pd.Timestamp("2024-01-02", tz="UTC"), cache=False)
+            result = pipeline.run(start=_START, end=_END, cache=False)
 
             assert len(result) == 5
             assert source.fetch_called
         finally:
             shutil.rmtree(cache_dir, ignore_errors=True)
 
+    def test_run_with_cache_follows_source_config(self, sample_dataframe_1, tmp_path, monkeypatch):
+        """Test that each cached run keys the source by its current config"""
+        from epftoolbox2.data.cache_manager import CacheManager
+
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        original = CacheManager.get_cache_key
+
+        def counting_get_cache_key(self, config):
+            calls.append(dict(config))
+            return original(self, config)
+
+        monkeypatch.setattr(CacheManager, "get_cache_key", counting_get_cache_key)
+        source = MockDataSource(data=sample_dataframe_1, prefix="a")
+        pipeline = DataPipeline(sources=[source])
+
+        first = pipeline.run(_START, _END, cache=True)
+        source.prefix = "b"
+        second = pipeline.run(_START, _END, cache=True)
+
+        assert calls == [{"source_type": "mock", "prefix": "a"}, {"source_type": "mock", "prefix": "b"}]
+        assert len(first) == len(second) == 5
+        cache_dirs = sorted(path.name for path in (tmp_path / ".cache" / "sources").iterdir())
+        assert cache_dirs == sorted(original(CacheManager(), config) for config in calls)
+
+    def test_run_with_cache_replaced_source_gets_own_key(self, sample_dataframe_1, tmp_path, monkeypatch):
+        """Test that a replaced source never reads the previous source's cache"""
+        monkeypatch.chdir(tmp_path)
+        pipeline = DataPipeline()
+
+        for i in range(20):
+            source = MockDataSource(data=sample_dataframe_1, prefix=f"source_{i}")
+            pipeline.sources.clear()
+            pipeline.add_source(source).run(_START, _END, cache=True)
+
+            # A cache hit on another source's key would skip the fetch
+            assert source.fetch_called
+
+        assert len(list((tmp_path / ".cache" / "sources").iterdir())) == 20
+
+    def test_run_with_cache_sources_sharing_key(self, tmp_path, monkeypatch):
+        """Test that concurrently fetched sources sharing a cache key fetch and read it consistently"""
+        monkeypatch.chdir(tmp_path)
+        fetches = []
+
+        class WindowSource(MockDataSource):
+            def fetch(self, start, end):
+                fetches.append((start, end))
+                dates = pd.date_range(start, end, freq="h", inclusive="left")
+                return pd.DataFrame({"price": np.arange(len(dates), dtype=float)}, index=dates)
+
+        pipeline = DataPipeline(sources=[WindowSource(prefix="shared") for _ in range(4)])
+
+        for day in range(20):
+            start = _START + pd.Timedelta(days=day)
+            result = pipeline.run(start, start + pd.Timedelta(days=1), cache=True)
+
+            assert result.shape == (24, 4)
+            assert (result.to_numpy() == np.arange(24, dtype=float)[:, None]).all()
+
+        # The first source to take the key fetches each window; the rest read it back
+        assert len(fetches) == 20
+
+    def test_run_with_csv_cache_file(self, sample_dataframe_1, tmp_path):
+        """Test that a .csv cache path saves and reloads the pipeline output"""
+        cache_file = tmp_path / "data.csv"
+
+        DataPipeline(sources=[MockDataSource(data=sample_dataframe_1)]).run(_START, _END, cache=str(cache_file))
+        source = MockDataSource(data=sample_dataframe_1)
+        result = DataPipeline(sources=[source]).run(_START, _END, cache=str(cache_file))
+
+        assert cache_file.exists()
+        assert not source.fetch_called
+        pd.testing.assert_frame_equal(result, sample_dataframe_1, check_freq=False, check_index_type=False)
+
+    def test_run_with_parquet_cache_file(self, sample_dataframe_1, tmp_path):
+        """Test that a .parquet cache path round-trips dtypes and timezone"""
+        pytest.importorskip("pyarrow")
+        cache_file = tmp_path / "data.parquet"
+
+        DataPipeline(sources=[MockDataSource(data=sample_dataframe_1)]).run(_START, _END, cache=str(cache_file))
+        source = MockDataSource(data=sample_dataframe_1)
+        result = DataPipeline(sources=[source]).run(_START, _END, cache=str(cache_file))
+
+        assert cache_file.exists()
+        assert not source.fetch_called
+        assert str(result.index.tz) == "UTC"
+        pd.testing.assert_frame_equal(result, sample_dataframe_1, check_freq=False)
+
 
 class TestDataPipelineSerialization:
     """Test pipeline serialization (save/load)"""
@@ -381,9 +398,9 @@ class TestDataPipelineSerialization:
         assert config["sources"][0]["class"] == "CalendarSource"
         assert config["sources"][0]["params"]["country"] == "PL"
 
-    def test_to_dict_with_transformer(self):
+    def test_to_dict_with_transformer(self, warsaw_transformer):
         """Test serializing pipeline with transformer to dict"""
-        pipeline = DataPipeline().add_transformer(TimezoneTransformer(target_tz="Europe/Warsaw"))
+        pipeline = DataPipeline().add_transformer(warsaw_transformer)
         config = pipeline.to_dict()
 
         assert len(config["transformers"]) == 1
@@ -401,12 +418,12 @@ class TestDataPipelineSerialization:
         assert config["validators"][0]["class"] == "NullCheckValidator"
         assert config["validators"][0]["params"]["columns"] == ["test"]
 
-    def test_save_and_load(self, tmp_path):
+    def test_save_and_load(self, tmp_path, warsaw_transformer):
         """Test saving and loading pipeline from YAML"""
         from epftoolbox2.data.sources import CalendarSource
         from epftoolbox2.data.validators import ContinuityValidator
 
-        pipeline = DataPipeline().add_source(CalendarSource(country="PL", holidays="binary", weekday="number")).add_transformer(TimezoneTransformer(target_tz="Europe/Warsaw")).add_validator(ContinuityValidator(freq="1h"))
+        pipeline = DataPipeline().add_source(CalendarSource(country="PL", holidays="binary", weekday="number")).add_transformer(warsaw_transformer).add_validator(ContinuityValidator(freq="1h"))
 
         yaml_path = tmp_path / "pipeline.yaml"
         pipeline.save(yaml_path)
@@ -4,7 +4,7 @@ from epftoolbox2.scalers import StandardScaler
 
 
 class TestStandardScaler:
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_data(self):
         np.random.seed(42)
         train_x = np.column_stack(
@@ -16,6 +16,9 @@ class TestStandardScaler:
         )
         train_y = np.random.randn(100) * 10 + 50  # price
         test_x = np.array([[5500.0, 18.0, 1]])
+        # Shared across tests, so fail loudly if anything writes into the inputs
+        for arr in (train_x, train_y, test_x):
+            arr.setflags(write=False)
         return train_x, train_y, test_x
 
     def test_fit_transform_scales_continuous(self, sample_data):
@@ -63,17 +66,12 @@ class TestStandardScaler:
         assert not np.isnan(train_x_scaled).any()
 
     def test_does_not_modify_original(self, sample_data):
-        train_x, train_y, test_x = sample_data
-        train_x_orig = train_x.copy()
-        train_y_orig = train_y.copy()
-        test_x_orig = test_x.copy()
+        before = [arr.tobytes() for arr in sample_data]
 
         scaler = StandardScaler()
-        scaler.fit_transform(train_x, train_y, test_x)
+        scaler.fit_transform(*sample_data)
 
-        np.testing.assert_array_equal(train_x, train_x_orig)
-        np.testing.assert_array_equal(train_y, train_y_orig)
-        np.testing.assert_array_equal(test_x, test_x_orig)
+        assert [arr.tobytes() for arr in sample_data] == before
 
     def test_get_scalable_mask(self):
         # Mix of continuous and binary columns
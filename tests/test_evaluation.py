@@ -12,18 +12,74 @@ from epftoolbox2.exporters.terminal import TerminalExporter
 from epftoolbox2.exporters.excel import ExcelExporter
 
 
+_SAMPLE_RESULTS = {
+    "model_a": [
+        {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
+        {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
+        {"prediction": 30, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02"},
+        {"prediction": 40, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02"},
+    ],
+    "model_b": [
+        {"prediction": 11, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
+        {"prediction": 19, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
+        {"prediction": 32, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02"},
+        {"prediction": 39, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02"},
+    ],
+}
+
+_SAMPLE_DF = pd.concat([pd.DataFrame(rows).assign(model=m) for m, rows in _SAMPLE_RESULTS.items()], ignore_index=True)
+
+_TERMINAL_RESULTS = {
+    "model_a": [
+        {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
+        {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
+    ],
+}
+
+_EXCEL_RESULTS = {
+    "model_a": [
+        {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
+        {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
+        {"prediction": 30, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
+        {"prediction": 40, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
+    ],
+    "model_b": [
+        {"prediction": 11, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
+        {"prediction": 19, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
+        {"prediction": 32, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
+        {"prediction": 39, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def report():
+    return EvaluationReport(_SAMPLE_RESULTS, [MAEEvaluator()])
+
+
+@pytest.fixture(scope="module")
+def frame_report():
+    return EvaluationReport.from_frame(_SAMPLE_DF, [MAEEvaluator()])
+
+
 class TestMAEEvaluator:
-    def test_compute_simple(self):
-        df = pd.DataFrame({"prediction": [10, 20, 30], "actual": [12, 18, 33]})
+    @pytest.fixture(scope="class")
+    def mae_df_simple(self):
+        return pd.DataFrame({"prediction": [10, 20, 30], "actual": [12, 18, 33]})
+
+    @pytest.fixture(scope="class")
+    def mae_df_exact(self):
+        return pd.DataFrame({"prediction": [10, 20, 30], "actual": [10, 20, 30]})
+
+    def test_compute_simple(self, mae_df_simple):
         evaluator = MAEEvaluator()
-        result = evaluator.compute(df)
+        result = evaluator.compute(mae_df_simple)
         expected = (2 + 2 + 3) / 3
         assert abs(result - expected) < 1e-9
 
-    def test_compute_zero_error(self):
-        df = pd.DataFrame({"prediction": [10, 20, 30], "actual": [10, 20, 30]})
+    def test_compute_zero_error(self, mae_df_exact):
         evaluator = MAEEvaluator()
-        assert evaluator.compute(df) == 0.0
+        assert evaluator.compute(mae_df_exact) == 0.0
 
     def test_name(self):
         evaluator = MAEEvaluator()
@@ -31,65 +87,39 @@ class TestMAEEvaluator:
 
 
 class TestEvaluationReport:
-    @pytest.fixture
-    def sample_results(self):
-        return {
-            "model_a": [
-                {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
-                {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
-                {"prediction": 30, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02"},
-                {"prediction": 40, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02"},
-            ],
-            "model_b": [
-                {"prediction": 11, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
-                {"prediction": 19, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
-                {"prediction": 32, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02"},
-                {"prediction": 39, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02"},
-            ],
-        }
-
-    def test_summary(self, sample_results):
-        report = EvaluationReport(sample_results, [MAEEvaluator()])
+    @pytest.mark.parametrize(
+        "method,keys,expected_len",
+        [
+            ("summary", (), 2),  # 2 models
+            ("by_hour", ("hour",), 4),  # 2 models × 2 hours
+            ("by_horizon", ("horizon",), 4),  # 2 models × 2 horizons
+            ("by_hour_horizon", ("hour", "horizon"), 8),  # 2 models × 2 hours × 2 horizons
+            ("by_year", ("year",), 2),  # 2 models × 1 year
+        ],
+    )
+    def test_grouping(self, report, method, keys, expected_len):
+        result = getattr(report, method)()
+
+        assert len(result) == expected_len
+        for col in ("model", *keys, "MAE"):
+            assert col in result.columns
+
+    def test_from_frame_matches_records(self, report, frame_report):
+        assert list(frame_report.results) == list(report.results)
+        for name, df in report.results.items():
+            pd.testing.assert_frame_equal(frame_report.results[name], df)
+
+    @pytest.mark.parametrize("method", ["summary", "by_hour", "by_horizon", "by_hour_horizon", "by_year", "by_year_horizon"])
+    def test_from_frame_method_outputs(self, report, frame_report, method):
+        pd.testing.assert_frame_equal(getattr(frame_report, method)(), getattr(report, method)())
+
+    def test_summary_values(self, report):
         summary = report.summary()
 
-        assert len(summary) == 2
-        assert "model" in summary.columns
-        assert "MAE" in summary.columns
-
         model_a_mae = summary[summary["model"] == "model_a"]["MAE"].iloc[0]
         expected_a = (2 + 2 + 3 + 2) / 4
         assert abs(model_a_mae - expected_a) < 1e-9
 
-    def test_by_hour(self, sample_results):
-        report = EvaluationReport(sample_results, [MAEEvaluator()])
-        by_hour = report.by_hour()
-
-        assert "hour" in by_hour.columns
-        assert "model" in by_hour.columns
-        assert len(by_hour) == 4  # 2 models × 2 hours
-
-    def test_by_horizon(self, sample_results):
-        report = EvaluationReport(sample_results, [MAEEvaluator()])
-        by_horizon = report.by_horizon()
-
-        assert "horizon" in by_horizon.columns
-        assert len(by_horizon) == 4  # 2 models × 2 horizons
-
-    def test_by_hour_horizon(self, sample_results):
-        report = EvaluationReport(sample_results, [MAEEvaluator()])
-        by_hh = report.by_hour_horizon()
-
-        assert "hour" in by_hh.columns
-        assert "horizon" in by_hh.columns
-        assert len(by_hh) == 8  # 2 models × 2 hours × 2 horizons
-
-    def test_by_year(self, sample_results):
-        report = EvaluationReport(sample_results, [MAEEvaluator()])
-        by_year = report.by_year()
-
-        assert "year" in by_year.columns
-        assert len(by_year) == 2  # 2 models × 1 year
-
 
 class TestModelPipeline:
     @pytest.fixture
@@ -175,13 +205,7 @@ class TestModelPipeline:
 class TestTerminalExporter:
     @pytest.fixture
     def sample_report(self):
-        results = {
-            "model_a": [
-                {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01"},
-                {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01"},
-            ],
-        }
-        return EvaluationReport(results, [MAEEvaluator()])
+        return EvaluationReport(_TERMINAL_RESULTS, [MAEEvaluator()])
 
     def test_init_default_show(self):
         exporter = TerminalExporter()
@@ -230,21 +254,7 @@ class TestTerminalExporter:
 class TestExcelExporter:
     @pytest.fixture
     def sample_report(self):
-        results = {
-            "model_a": [
-                {"prediction": 10, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
-                {"prediction": 20, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
-                {"prediction": 30, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
-                {"prediction": 40, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
-            ],
-            "model_b": [
-                {"prediction": 11, "actual": 12, "hour": 0, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
-                {"prediction": 19, "actual": 18, "hour": 1, "horizon": 1, "target_date": "2024-01-01", "run_date": "2023-12-31", "day_in_test": 0},
-                {"prediction": 32, "actual": 33, "hour": 0, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
-                {"prediction": 39, "actual": 38, "hour": 1, "horizon": 2, "target_date": "2024-01-02", "run_date": "2024-01-01", "day_in_test": 1},
-            ],
-        }
-        return EvaluationReport(results, [MAEEvaluator()])
+        return EvaluationReport(_EXCEL_RESULTS, [MAEEvaluator()])
 
     def test_init_default_sheets(self):
         with tempfile.TemporaryDirectory() as tmpdir:
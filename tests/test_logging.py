@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from epftoolbox2.logging import get_console, shared_progress
+
+
+class TestSharedProgress:
+    def test_uses_shared_console(self):
+        with shared_progress() as progress:
+            assert progress.console is get_console()
+
+    def test_concurrent_callers_share_one_display(self):
+        barrier = Barrier(3)
+
+        def enter(i):
+            with shared_progress() as progress:
+                progress.add_task(f"source {i}", total=1)
+                barrier.wait(timeout=5)
+                return progress
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            displays = list(pool.map(enter, range(3)))
+
+        assert displays[0] is displays[1] is displays[2]
+        assert len(displays[0].tasks) == 3
+        assert not displays[0].live.is_started
+
+    def test_new_display_after_last_caller_exits(self):
+        with shared_progress() as first:
+            pass
+        with shared_progress() as second:
+            assert second is not first
+            assert second.live.is_started